@@ -34,6 +34,9 @@ _DEFAULT_EVAL_PERIOD_MINUTES = 240
 _TESTNET_EVAL_PERIOD_MINUTES = int(os.getenv('MINER_EVAL_PERIOD_MINUTES', _DEFAULT_EVAL_PERIOD_MINUTES))
 MIN_EVALUATION_PERIOD = dt.timedelta(minutes=_TESTNET_EVAL_PERIOD_MINUTES)
 
+# How many zipcodes a validator validates concurrently when scoring an epoch.
+EPOCH_ZIPCODE_VALIDATION_CONCURRENCY = 4
+
 # Miner compressed index cache freshness.
 MINER_CACHE_FRESHNESS = dt.timedelta(minutes=20)
 
@@ -11,6 +11,7 @@ from typing import Any, Callable, List, Optional, Dict
 import bittensor as bt
 from functools import lru_cache, update_wrapper
 from common.date_range import DateRange
+import orjson
 
 _KB = 1024
 _MB = 1024 * _KB
@@ -171,6 +172,22 @@ def deserialize_from_file(filename: str) -> Any:
     return obj
 
 
+def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serializes 'obj' to UTF-8 JSON bytes with orjson.
+    Datetimes are written as ISO 8601 strings; other non-JSON values are converted with str().
+    """
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(obj, default=str, option=option)
+
+
+def json_loads(data: Any) -> Any:
+    """
+    Parses JSON from str or bytes with orjson.
+    """
+    return orjson.loads(data)
+
+
 # LRU Cache with TTL
 def ttl_cache(maxsize: int = 128, typed: bool = False, ttl: int = -1):
     """
@@ -346,6 +346,27 @@ def add_args(neuron_type: NeuronType, parser):
             help="Set this flag to true to run the miner in offline mode.",
             default=False,
         )
+
+        parser.add_argument(
+            "--zipcode_max_concurrency",
+            type=int,
+            help="Maximum number of assigned zipcodes to scrape concurrently during an epoch.",
+            default=4,
+        )
+
+        parser.add_argument(
+            "--zipcode_cache_dir",
+            type=str,
+            help="Directory for caching RapidAPI zipcode search responses, so restarts within an epoch do not pay for the same pages again. Caching is disabled if unset.",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--zipcode_cache_ttl_seconds",
+            type=int,
+            help="Maximum age in seconds of a cached zipcode search response before it is fetched again.",
+            default=15 * 60,
+        )
     else:
         raise ValueError(f"Invalid neuron type: {neuron_type}")
 
@@ -15,9 +15,12 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import asyncio
 from collections import defaultdict
+import concurrent.futures
 import copy
 import sys
+import tempfile
 import threading
 import time
 import traceback
@@ -25,6 +28,7 @@ import typing
 import os
 import bittensor as bt
 import datetime as dt
+import inspect
 from common import constants, utils
 from common.data import CompressedMinerIndex, TimeBucket
 from common.protocol import (
@@ -40,6 +44,7 @@ from scraping.miner_provider import MinerScraperProvider
 from storage.miner.sqlite_miner_storage import SqliteMinerStorage
 from neurons.config import NeuronType, check_config, create_config
 from upload_utils.s3_uploader import S3PartitionedUploader
+from upload_utils.s3_utils import S3Auth
 from dynamic_desirability.desirability_retrieval import sync_run_retrieval
 
 from common.data import DataLabel, DataSource, DataEntity
@@ -387,20 +392,30 @@ class Miner:
         except Exception as e:
             bt.logging.warning(f"Failed to update initial status: {e}")
         
-        # Mine each assigned zipcode
         completed_zipcodes = []
         total_listings = 0
         
+        # Skip zipcodes already stored for this epoch (e.g. after a restart mid-epoch)
+        stored_counts = self.storage.get_epoch_zipcode_counts(epoch_id, self.wallet.hotkey.ss58_address)
         for zipcode_info in zipcodes:
+            listing_count = stored_counts.get(zipcode_info['zipcode'])
+            if listing_count:
+                completed_zipcodes.append({
+                    'zipcode': zipcode_info['zipcode'],
+                    'listingsScraped': listing_count,
+                    'completedAt': dt.datetime.utcnow().isoformat() + 'Z'
+                })
+                total_listings += listing_count
+        
+        if completed_zipcodes:
+            bt.logging.info(f"Skipping {len(completed_zipcodes)} zipcodes already stored for epoch {epoch_id}")
+        pending_zipcodes = [z for z in zipcodes if not stored_counts.get(z['zipcode'])]
+        
+        def handle_result(zipcode_info: dict, listings_data: list):
+            nonlocal total_listings
             zipcode = zipcode_info['zipcode']
-            expected_listings = zipcode_info['expectedListings']
-            
-            bt.logging.info(f"Mining zipcode {zipcode} (target: {expected_listings} listings)")
             
             try:
-                # Execute scraping for this specific zipcode
-                listings_data = self.scrape_zipcode_data(zipcode, expected_listings)
-                
                 if listings_data:
                     # Store data locally
                     self.store_zipcode_data(zipcode, listings_data, epoch_id)
@@ -432,7 +447,9 @@ class Miner:
                         
             except Exception as e:
                 bt.logging.error(f"Failed to mine zipcode {zipcode}: {e}")
-                continue
+        
+        # Scrape the remaining zipcodes concurrently, storing each one as it finishes
+        self.scrape_zipcodes_data(pending_zipcodes, handle_result)
         
         # Upload all data to S3
         bt.logging.info("Uploading epoch data to S3...")
@@ -457,47 +474,81 @@ class Miner:
         except Exception as e:
             bt.logging.error(f"Failed to update final status: {e}")
     
-    def scrape_zipcode_data(self, zipcode: str, expected_listings: int) -> list:
+    def scrape_zipcodes_data(self, zipcodes: list, on_result) -> None:
         """
-        Scrape real estate data for a specific zipcode
+        Scrape real estate data for all assigned zipcodes
         
-        This integrates with the existing scraping system to target specific zipcodes
+        Zipcodes are scraped concurrently on a single event loop, bounded by
+        --zipcode_max_concurrency. One scraper instance is shared so that its
+        rate limiting applies across all in-flight zipcodes.
         
         Args:
-            zipcode: Target zipcode to scrape
-            expected_listings: Expected number of listings
-            
-        Returns:
-            List of scraped listing data
+            zipcodes: Zipcode assignments, each with 'zipcode' and 'expectedListings'
+            on_result: Called with (zipcode_info, listings) as each zipcode finishes
         """
-        
-        bt.logging.info(f"Scraping data for zipcode {zipcode} (target: {expected_listings})")
-        
         try:
             # Get configured zipcode scraper
             scraper = self.get_zipcode_scraper()
             
             if not scraper:
                 bt.logging.error("No zipcode scraper configured")
-                return []
+                for zipcode_info in zipcodes:
+                    on_result(zipcode_info, [])
+                return
             
             # Log scraper info
             scraper_info = scraper.get_scraper_info()
             bt.logging.info(f"Using scraper: {scraper_info['name']} v{scraper_info['version']} ({scraper_info['source']})")
             
-            # Scrape the zipcode
-            listings = scraper.scrape_zipcode(
-                zipcode=zipcode,
-                target_count=expected_listings,
-                timeout=300  # 5 minute timeout
-            )
-            
-            bt.logging.success(f"Scraped {len(listings)} listings for zipcode {zipcode}")
-            return listings
+            # Mining runs in its own thread, outside any event loop
+            max_concurrency = getattr(self.config, 'zipcode_max_concurrency', 4)
+            asyncio.run(self._scrape_zipcodes_async(scraper, zipcodes, max_concurrency, on_result))
             
         except Exception as e:
-            bt.logging.error(f"Error scraping zipcode {zipcode}: {e}")
-            return []
+            bt.logging.error(f"Error scraping zipcodes: {e}")
+    
+    async def _scrape_zipcodes_async(self, scraper, zipcodes: list, max_concurrency: int, on_result) -> None:
+        """Scrape zipcodes concurrently with at most max_concurrency in flight, handing off results in completion order"""
+        # Custom scrapers written before the interface became async may still be
+        # synchronous. Run those in a worker thread, one zipcode at a time as they
+        # were before, since they were never written to be thread-safe.
+        is_async_scraper = inspect.iscoroutinefunction(scraper.scrape_zipcode)
+        if not is_async_scraper:
+            bt.logging.warning("Zipcode scraper is synchronous; scraping zipcodes one at a time in a worker thread")
+            max_concurrency = 1
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def scrape_one(zipcode_info: dict) -> tuple:
+            zipcode = zipcode_info['zipcode']
+            expected_listings = zipcode_info['expectedListings']
+            
+            async with semaphore:
+                bt.logging.info(f"Mining zipcode {zipcode} (target: {expected_listings} listings)")
+                try:
+                    scrape_kwargs = dict(
+                        zipcode=zipcode,
+                        target_count=expected_listings,
+                        timeout=300  # 5 minute timeout
+                    )
+                    if is_async_scraper:
+                        listings = await scraper.scrape_zipcode(**scrape_kwargs)
+                    else:
+                        listings = await asyncio.to_thread(scraper.scrape_zipcode, **scrape_kwargs)
+                except Exception as e:
+                    bt.logging.error(f"Error scraping zipcode {zipcode}: {e}")
+                    return zipcode_info, []
+            
+            bt.logging.success(f"Scraped {len(listings)} listings for zipcode {zipcode}")
+            return zipcode_info, listings
+        
+        tasks = [asyncio.create_task(scrape_one(zipcode_info)) for zipcode_info in zipcodes]
+        for i, next_done in enumerate(asyncio.as_completed(tasks), 1):
+            zipcode_info, listings = await next_done
+            # on_result does SQLite writes and periodic status calls; keep them off the
+            # loop so in-flight scrapes aren't stalled. Results are still handed off
+            # one at a time, so on_result never runs concurrently with itself.
+            await asyncio.to_thread(on_result, zipcode_info, listings)
+            bt.logging.info(f"Zipcode progress: {i}/{len(tasks)}")
     
     def get_zipcode_scraper(self):
         """
@@ -535,7 +586,9 @@ class Miner:
                 config = ZipcodeScraperConfig(
                     max_requests_per_minute=20,  # Stay within rate limits
                     request_delay_seconds=3.0,   # Conservative delay
-                    max_retries=2
+                    max_retries=2,
+                    cache_dir=getattr(self.config, 'zipcode_cache_dir', None),
+                    cache_ttl_seconds=getattr(self.config, 'zipcode_cache_ttl_seconds', 15 * 60)
                 )
                 
                 return create_rapidapi_zillow_scraper(rapidapi_key, config, "RecentlySold")
@@ -572,11 +625,12 @@ class Miner:
             bt.logging.info(f"Storing {len(listings_data)} listings for zipcode {zipcode}")
             
             # Add epoch metadata to each listing
+            submission_timestamp = dt.datetime.now(dt.timezone.utc).isoformat()
             for listing in listings_data:
                 listing['epoch_id'] = epoch_id
                 listing['zipcode'] = zipcode
                 listing['scraped_for_epoch'] = True
-                listing['submission_timestamp'] = dt.datetime.now(dt.timezone.utc).isoformat()
+                listing['submission_timestamp'] = submission_timestamp
             
             # Store in existing storage system using new epoch methods
             success = self.storage.store_epoch_zipcode_data(
@@ -630,34 +684,43 @@ class Miner:
             upload_success = True
             miner_hotkey = self.wallet.hotkey.ss58_address
             
-            for zipcode, listings_data in epoch_data.items():
-                try:
-                    # Create epoch-specific data structure
-                    zipcode_upload_data = {
-                        'epoch_id': epoch_id,
-                        'zipcode': zipcode,
-                        'miner_hotkey': miner_hotkey,
-                        'submission_timestamp': dt.datetime.now(dt.timezone.utc).isoformat(),
-                        'listing_count': len(listings_data),
-                        'listings': listings_data
-                    }
-                    
-                    # Upload this zipcode's data
-                    zipcode_success = self._upload_zipcode_data_to_s3(
-                        zipcode_upload_data, s3_creds, epoch_id, zipcode
-                    )
-                    
-                    if zipcode_success:
-                        # Mark as uploaded in storage
-                        self.storage.mark_epoch_data_uploaded(epoch_id, zipcode, miner_hotkey)
-                        bt.logging.success(f"Uploaded data for zipcode {zipcode}")
-                    else:
-                        bt.logging.error(f"Failed to upload data for zipcode {zipcode}")
+            def upload_zipcode(zipcode: str, listings_data: list) -> bool:
+                # Create epoch-specific data structure
+                zipcode_upload_data = {
+                    'epoch_id': epoch_id,
+                    'zipcode': zipcode,
+                    'miner_hotkey': miner_hotkey,
+                    'submission_timestamp': dt.datetime.now(dt.timezone.utc).isoformat(),
+                    'listing_count': len(listings_data),
+                    'listings': listings_data
+                }
+                
+                # Upload this zipcode's data
+                return self._upload_zipcode_data_to_s3(
+                    zipcode_upload_data, s3_creds, epoch_id, zipcode
+                )
+            
+            # Zipcode uploads are independent network round-trips, so run them in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(epoch_data))) as executor:
+                futures = {
+                    executor.submit(upload_zipcode, zipcode, listings_data): zipcode
+                    for zipcode, listings_data in epoch_data.items()
+                }
+                
+                for future in concurrent.futures.as_completed(futures):
+                    zipcode = futures[future]
+                    try:
+                        if future.result():
+                            # Mark as uploaded in storage
+                            self.storage.mark_epoch_data_uploaded(epoch_id, zipcode, miner_hotkey)
+                            bt.logging.success(f"Uploaded data for zipcode {zipcode}")
+                        else:
+                            bt.logging.error(f"Failed to upload data for zipcode {zipcode}")
+                            upload_success = False
+                            
+                    except Exception as zipcode_error:
+                        bt.logging.error(f"Error uploading zipcode {zipcode}: {zipcode_error}")
                         upload_success = False
-                        
-                except Exception as zipcode_error:
-                    bt.logging.error(f"Error uploading zipcode {zipcode}: {zipcode_error}")
-                    upload_success = False
             
             if upload_success:
                 bt.logging.success(f"Successfully uploaded all epoch {epoch_id} data to S3")
@@ -685,13 +748,9 @@ class Miner:
             True if upload successful
         """
         try:
-            import json
-            import tempfile
-            import pandas as pd
-            
             # Create temporary file for upload
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(zipcode_data, temp_file, default=str, indent=2)
+            with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as temp_file:
+                temp_file.write(utils.json_dumps_bytes(zipcode_data, indent=True))
                 temp_file_path = temp_file.name
             
             try:
@@ -701,7 +760,6 @@ class Miner:
                 s3_path = f"data/hotkey={zipcode_data['miner_hotkey']}/epoch={epoch_id}/zipcode={zipcode}/data_{timestamp}.json"
                 
                 # Use the S3Auth utility for upload
-                from upload_utils.s3_utils import S3Auth
                 s3_auth = S3Auth(self.config.s3_auth_url)  # Use existing auth URL
                 
                 # Upload using the credentials from ResiLabs API
@@ -15,6 +15,7 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import concurrent.futures
 import copy
 import json
 import sys
@@ -30,6 +31,7 @@ import os
 import wandb
 import subprocess
 import traceback
+import xml.etree.ElementTree as ET
 from common.metagraph_syncer import MetagraphSyncer
 from neurons.config import NeuronType, check_config, create_config
 from dynamic_desirability.desirability_retrieval import sync_run_retrieval
@@ -1032,7 +1034,7 @@ class Validator:
         """Save epoch cache to disk"""
         try:
             with open(self.epoch_cache_file, 'w') as f:
-                json.dump(self.epoch_cache, f, indent=2)
+                f.write(json.dumps(self.epoch_cache, indent=2))
             bt.logging.debug(f"Saved epoch cache with {len(self.epoch_cache)} epochs")
         except Exception as e:
             bt.logging.error(f"Failed to save epoch cache: {e}")
@@ -1393,8 +1395,12 @@ class Validator:
                     
                     bt.logging.info(f"Processing completed epoch: {epoch_id}")
                     
-                    # Download epoch submissions by zipcode
-                    zipcode_submissions = self.download_epoch_submissions_by_zipcode(epoch_id)
+                    # Download epoch submissions by zipcode, fetching the epoch's expected
+                    # listing counts alongside since the two are independent
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                        expected_future = executor.submit(self.get_expected_listings_by_zipcode, epoch_id)
+                        zipcode_submissions = self.download_epoch_submissions_by_zipcode(epoch_id)
+                        expected_by_zipcode = expected_future.result()
                     
                     if not zipcode_submissions:
                         bt.logging.warning(f"No submissions found for epoch {epoch_id}")
@@ -1405,25 +1411,11 @@ class Validator:
                     epoch_nonce = current_epoch.get('nonce', epoch_id)
                     
                     # Process each zipcode with multi-tier validation
-                    all_zipcode_results = []
-                    
-                    for zipcode, submissions in zipcode_submissions.items():
-                        bt.logging.info(f"Validating {len(submissions)} submissions for zipcode {zipcode}")
-                        
-                        # Get expected listings for this zipcode
-                        expected_listings = self.get_expected_listings_for_zipcode(zipcode, epoch_id)
-                        
-                        # Validate and rank submissions for this zipcode
-                        zipcode_result = asyncio.run(
-                            self.zipcode_scorer.validate_and_rank_zipcode_submissions(
-                                zipcode=zipcode,
-                                submissions=submissions,
-                                expected_listings=expected_listings,
-                                epoch_nonce=epoch_nonce
-                            )
+                    all_zipcode_results = asyncio.run(
+                        self._validate_epoch_zipcodes(
+                            epoch_id, epoch_nonce, zipcode_submissions, expected_by_zipcode
                         )
-                        
-                        all_zipcode_results.append(zipcode_result)
+                    )
                     
                     # Calculate final proportional weights across all zipcodes
                     final_scores = self.zipcode_scorer.calculate_epoch_proportional_weights(all_zipcode_results)
@@ -1474,6 +1466,41 @@ class Validator:
                 bt.logging.error(f"Traceback: {traceback.format_exc()}")
                 time.sleep(300)  # Wait 5 minutes on error
     
+    async def _validate_epoch_zipcodes(self, epoch_id: str, epoch_nonce: str, zipcode_submissions: dict,
+                                       expected_by_zipcode: Dict[str, int]) -> list:
+        """
+        Validate and rank every zipcode's submissions for an epoch
+        
+        Zipcodes are independent, so up to EPOCH_ZIPCODE_VALIDATION_CONCURRENCY are
+        validated at once. Submissions within a zipcode stay sequential.
+        
+        Returns:
+            List of zipcode results, in the same order as zipcode_submissions
+        """
+        semaphore = asyncio.Semaphore(constants.EPOCH_ZIPCODE_VALIDATION_CONCURRENCY)
+        
+        async def validate_zipcode(zipcode: str, submissions: list) -> dict:
+            async with semaphore:
+                bt.logging.info(f"Validating {len(submissions)} submissions for zipcode {zipcode}")
+                
+                # Get expected listings for this zipcode
+                expected_listings = self.get_expected_listings_for_zipcode(
+                    zipcode, epoch_id, expected_by_zipcode
+                )
+                
+                # Validate and rank submissions for this zipcode
+                return await self.zipcode_scorer.validate_and_rank_zipcode_submissions(
+                    zipcode=zipcode,
+                    submissions=submissions,
+                    expected_listings=expected_listings,
+                    epoch_nonce=epoch_nonce
+                )
+        
+        return await asyncio.gather(*(
+            validate_zipcode(zipcode, submissions)
+            for zipcode, submissions in zipcode_submissions.items()
+        ))
+    
     def download_epoch_submissions_by_zipcode(self, epoch_id: str) -> dict:
         """
         Download and organize miner submissions by zipcode for an epoch
@@ -1495,14 +1522,19 @@ class Validator:
             
             bt.logging.info(f"Checking {len(active_miners)} active miners for epoch {epoch_id} submissions")
             
-            # Download submissions from each miner
+            # Download submissions from each miner. Each miner needs its own S3 access
+            # request and file listing, so fetch several miners at once.
             zipcode_submissions = {}
             successful_downloads = 0
             
-            for miner_hotkey in active_miners:
-                try:
-                    miner_submissions = self._download_miner_epoch_data(epoch_id, miner_hotkey)
-                    
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                # map() keeps metagraph order so submission ordering stays deterministic
+                all_miner_submissions = executor.map(
+                    lambda miner_hotkey: self._download_miner_epoch_data(epoch_id, miner_hotkey),
+                    active_miners
+                )
+                
+                for miner_hotkey, miner_submissions in zip(active_miners, all_miner_submissions):
                     if miner_submissions:
                         successful_downloads += 1
                         
@@ -1516,10 +1548,6 @@ class Validator:
                             zipcode_submissions[zipcode].append(submission_data)
                             
                         bt.logging.debug(f"Downloaded {len(miner_submissions)} zipcode submissions from {miner_hotkey[:8]}...")
-                    
-                except Exception as miner_error:
-                    bt.logging.debug(f"No epoch data from miner {miner_hotkey[:8]}...: {miner_error}")
-                    continue
             
             bt.logging.info(f"Downloaded epoch {epoch_id} data from {successful_downloads} miners across {len(zipcode_submissions)} zipcodes")
             
@@ -1548,7 +1576,6 @@ class Validator:
                 return {}
             
             # Download and parse S3 file list
-            import requests
             response = requests.get(miner_url, timeout=30)
             
             if response.status_code != 200:
@@ -1560,20 +1587,32 @@ class Validator:
             if not epoch_files:
                 return {}
             
-            # Download and parse each epoch file
+            # Each download thread keeps its own session (requests.Session is not
+            # documented as thread-safe), so its GETs reuse a keep-alive connection
+            # to the bucket instead of a new TCP/TLS handshake per file
+            thread_state = threading.local()
+            sessions = []
+            
+            def download_file(file_info: dict) -> dict:
+                session = getattr(thread_state, 'session', None)
+                if session is None:
+                    session = thread_state.session = requests.Session()
+                    sessions.append(session)
+                return self._download_and_parse_epoch_file(file_info, session)
+            
+            # Download and parse the epoch files in parallel; each is an independent GET.
+            # Results keep listing order so the latest file for a zipcode still wins.
             miner_epoch_data = {}
             
-            for file_info in epoch_files:
-                try:
-                    file_data = self._download_and_parse_epoch_file(file_info)
-                    
-                    if file_data and 'zipcode' in file_data:
-                        zipcode = file_data['zipcode']
-                        miner_epoch_data[zipcode] = file_data
-                        
-                except Exception as file_error:
-                    bt.logging.debug(f"Failed to download epoch file {file_info.get('key', 'unknown')}: {file_error}")
-                    continue
+            try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(epoch_files))) as executor:
+                    for file_data in executor.map(download_file, epoch_files):
+                        if file_data and 'zipcode' in file_data:
+                            zipcode = file_data['zipcode']
+                            miner_epoch_data[zipcode] = file_data
+            finally:
+                for session in sessions:
+                    session.close()
             
             return miner_epoch_data
             
@@ -1595,8 +1634,6 @@ class Validator:
             List of epoch file info
         """
         try:
-            import xml.etree.ElementTree as ET
-            
             root = ET.fromstring(xml_content)
             namespace = {'s3': 'http://s3.amazonaws.com/doc/2006-03-01/'}
             
@@ -1638,28 +1675,26 @@ class Validator:
             bt.logging.error(f"Error parsing S3 XML for epoch files: {e}")
             return []
     
-    def _download_and_parse_epoch_file(self, file_info: dict) -> dict:
+    def _download_and_parse_epoch_file(self, file_info: dict, session: Optional[requests.Session] = None) -> dict:
         """
         Download and parse an individual epoch file
         
         Args:
             file_info: File information from S3
+            session: Optional HTTP session to reuse connections across files
             
         Returns:
             Parsed file data
         """
         try:
-            import requests
-            import json
-            
             # Download the file
-            response = requests.get(file_info['download_url'], timeout=30)
+            response = (session or requests).get(file_info['download_url'], timeout=30)
             
             if response.status_code != 200:
                 return {}
             
-            # Parse JSON data
-            file_data = json.loads(response.text)
+            # Parse JSON straight from the response bytes
+            file_data = utils.json_loads(response.content)
             
             # Validate required fields
             required_fields = ['epoch_id', 'zipcode', 'miner_hotkey', 'listings']
@@ -1680,37 +1715,60 @@ class Validator:
             bt.logging.error(f"Error downloading epoch file {file_info.get('key', 'unknown')}: {e}")
             return {}
     
-    def get_expected_listings_for_zipcode(self, zipcode: str, epoch_id: str) -> int:
+    def get_expected_listings_by_zipcode(self, epoch_id: str) -> Dict[str, int]:
         """
-        Get expected number of listings for a zipcode in an epoch.
-        Fetches directly from API using epoch ID.
+        Get expected number of listings for every zipcode in an epoch.
+        Fetches the epoch assignments from the API once.
         
         Args:
-            zipcode: Target zipcode
             epoch_id: Epoch ID in format "YYYY-MM-DDTHH-00-00"
             
         Returns:
-            Expected number of listings
+            Dict mapping zipcode -> expected listings (empty if unavailable)
         """
         try:
             if not self.api_client:
                 bt.logging.warning("API client not initialized")
-                return self._get_default_expected_listings(zipcode)
+                return {}
             
             # Fetch epoch assignments directly from API
             epoch_data = self.api_client.get_epoch_assignments(epoch_id)
             
             if not epoch_data or not epoch_data.get('success'):
                 bt.logging.warning(f"Failed to fetch assignments for epoch {epoch_id}")
-                return self._get_default_expected_listings(zipcode)
+                return {}
             
-            # Find the specific zipcode in the zipcodes list
-            zipcodes_list = epoch_data.get('zipcodes', [])
-            for zipcode_info in zipcodes_list:
-                if zipcode_info.get('zipcode') == zipcode:
-                    expected = zipcode_info.get('expectedListings', 0)
-                    bt.logging.debug(f"Found expected listings for {zipcode} in epoch {epoch_id}: {expected}")
-                    return expected
+            return {
+                zipcode_info.get('zipcode'): zipcode_info.get('expectedListings', 0)
+                for zipcode_info in epoch_data.get('zipcodes', [])
+            }
+            
+        except Exception as e:
+            bt.logging.error(f"Error getting expected listings for epoch {epoch_id}: {e}")
+            return {}
+    
+    def get_expected_listings_for_zipcode(self, zipcode: str, epoch_id: str,
+                                          expected_by_zipcode: Optional[Dict[str, int]] = None) -> int:
+        """
+        Get expected number of listings for a zipcode in an epoch.
+        Fetches directly from API using epoch ID.
+        
+        Args:
+            zipcode: Target zipcode
+            epoch_id: Epoch ID in format "YYYY-MM-DDTHH-00-00"
+            expected_by_zipcode: Preloaded result of get_expected_listings_by_zipcode, if available
+            
+        Returns:
+            Expected number of listings
+        """
+        try:
+            if expected_by_zipcode is None:
+                expected_by_zipcode = self.get_expected_listings_by_zipcode(epoch_id)
+            
+            if zipcode in expected_by_zipcode:
+                expected = expected_by_zipcode[zipcode]
+                bt.logging.debug(f"Found expected listings for {zipcode} in epoch {epoch_id}: {expected}")
+                return expected
             
             bt.logging.warning(f"Zipcode {zipcode} not found in epoch {epoch_id} assignments")
             return self._get_default_expected_listings(zipcode)
@@ -1830,7 +1888,7 @@ class Validator:
 
             # Create temporary file
             with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(validation_result, temp_file, indent=2, default=str)
+                temp_file.write(json.dumps(validation_result, indent=2, default=str))
                 temp_file_path = temp_file.name
 
             try:
@@ -1962,7 +2020,7 @@ class Validator:
             s3_key = filename
             
             with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(validation_result, temp_file, indent=2, default=str)
+                temp_file.write(json.dumps(validation_result, indent=2, default=str))
                 temp_file_path = temp_file.name
             
             try:
@@ -2008,14 +2066,16 @@ class Validator:
             # Convert miner scores to weight tensor
             metagraph = self.evaluator.metagraph
             weights = torch.zeros(len(metagraph.hotkeys))
+            
+            # Index hotkeys once rather than a linear hotkeys.index() scan per miner
+            uid_by_hotkey = {hotkey: uid for uid, hotkey in enumerate(metagraph.hotkeys)}
 
             for hotkey, score in miner_scores.items():
-                try:
-                    uid = metagraph.hotkeys.index(hotkey)
-                    weights[uid] = score
-                except ValueError:
+                uid = uid_by_hotkey.get(hotkey)
+                if uid is None:
                     bt.logging.warning(f"Miner {hotkey[:8]} not found in metagraph")
                     continue
+                weights[uid] = score
  
             bt.logging.info(f"Setting weights for {(weights > 0).sum()} miners")
 
@@ -8,6 +8,10 @@ import bittensor as bt
 import json
 import asyncio
 
+from common.data import DataEntity, DataSource
+from scraping.scraper import ValidationResult
+from vali_utils import utils as vali_utils
+
 
 class ZipcodeCompetitiveScorer:
     """
@@ -30,6 +34,9 @@ class ZipcodeCompetitiveScorer:
         
         # Reference to MinerEvaluator for validation (injected after initialization)
         self.miner_evaluator = miner_evaluator
+        
+        # ((event loop, scraper id), scraper) reused for Tier 3 spot checks within one epoch run
+        self._spot_check_scraper = None
     
     def set_miner_evaluator(self, miner_evaluator):
         """Inject the MinerEvaluator instance for validation"""
@@ -147,6 +154,8 @@ class ZipcodeCompetitiveScorer:
                 'listing_count': winner['listing_count']
             }
         
+        validated_hotkeys = {w['miner_hotkey'] for w in winners} | {p['miner_hotkey'] for p in participants}
+        
         result = {
             'zipcode': zipcode,
             'expected_listings': expected_listings,
@@ -158,9 +167,7 @@ class ZipcodeCompetitiveScorer:
             'validation_summary': {
                 'winners_found': len(winners),
                 'participants_found': len(participants),
-                'total_validated': len([s for s in sorted_submissions if s['miner_hotkey'] in 
-                                      [w['miner_hotkey'] for w in winners] + 
-                                      [p['miner_hotkey'] for p in participants]])
+                'total_validated': sum(1 for s in sorted_submissions if s['miner_hotkey'] in validated_hotkeys)
             }
         }
         
@@ -187,11 +194,9 @@ class ZipcodeCompetitiveScorer:
         Returns:
             Dict with validation results
         """
-        from common.data import DataEntity, DataSource
-        from vali_utils import utils as vali_utils
-        
         # Convert submission listings to DataEntity format
         entities = []
+        parsed_listings = []  # Content of each entity, so Tier 2 need not re-parse it
         for listing in submission.get('listings', []):
             try:
                 # Create DataEntity from listing
@@ -204,6 +209,7 @@ class ZipcodeCompetitiveScorer:
                     content_size_bytes=len(content)
                 )
                 entities.append(entity)
+                parsed_listings.append(listing)
             except Exception as e:
                 bt.logging.debug(f"Failed to convert listing to DataEntity: {e}")
                 continue
@@ -218,7 +224,6 @@ class ZipcodeCompetitiveScorer:
             }
         
         # Check for duplicates using the same 4-layer check as real-time validation
-        from vali_utils import utils as vali_utils
         unique = vali_utils.are_entities_unique(entities)
         if not unique:
             bt.logging.info(f"Submission failed duplicate check (zpid or URI-zpid consistency)")
@@ -245,7 +250,9 @@ class ZipcodeCompetitiveScorer:
             }
         
         # Tier 2: Quality & Epoch Compliance validation (same as real-time)
-        tier2_passes, tier2_reason, tier2_metrics = self.miner_evaluator._apply_tier2_quality_validation(entities)
+        tier2_passes, tier2_reason, tier2_metrics = self.miner_evaluator._apply_tier2_quality_validation(
+            entities, parsed_listings=parsed_listings
+        )
         
         if not tier2_passes:
             return {
@@ -275,8 +282,6 @@ class ZipcodeCompetitiveScorer:
         data_source = entities[0].source if entities else DataSource.SZILL_VALI
         
         # Validate entities using scraper
-        from common.validation_result import ValidationResult
-        
         # Skip unsupported data sources
         if data_source in [DataSource.X, DataSource.REDDIT, DataSource.YOUTUBE]:
             bt.logging.debug(f"Data source {data_source} not supported for Tier 3 - marking as pass")
@@ -288,9 +293,7 @@ class ZipcodeCompetitiveScorer:
         else:
             # Use the scraper provider from miner_evaluator
             try:
-                scraper = self.miner_evaluator.scraper_provider.get(
-                    self.miner_evaluator.PREFERRED_SCRAPERS[data_source]
-                )
+                scraper = self._get_spot_check_scraper(data_source)
                 validation_results = await scraper.validate(entities_to_validate)
             except Exception as e:
                 bt.logging.error(f"Scraper validation failed: {e}")
@@ -317,6 +320,21 @@ class ZipcodeCompetitiveScorer:
             'tier3': {'passes': tier3_passes, 'reason': tier3_reason, 'metrics': tier3_metrics}
         }
     
+    def _get_spot_check_scraper(self, data_source: DataSource):
+        """
+        Get the Tier 3 scraper for a data source, shared by all submissions validated on the current event loop
+        
+        Sharing one instance keeps its request concurrency limit global across concurrently validated
+        zipcodes. Scrapers hold loop-bound primitives, so a new one is created for each event loop.
+        """
+        scraper_id = self.miner_evaluator.PREFERRED_SCRAPERS[data_source]
+        key = (asyncio.get_running_loop(), scraper_id)
+        
+        if self._spot_check_scraper is None or self._spot_check_scraper[0] != key:
+            self._spot_check_scraper = (key, self.miner_evaluator.scraper_provider.get(scraper_id))
+        
+        return self._spot_check_scraper[1]
+    
     def calculate_epoch_proportional_weights(self, all_zipcode_results: List[Dict]) -> Dict[str, Any]:
         """
         Calculate final proportional weights across all zipcodes in epoch
@@ -372,22 +390,21 @@ class ZipcodeCompetitiveScorer:
             zipcode = result['zipcode']
             zipcode_weight = zipcode_weights[zipcode]
             
-            bt.logging.debug(f"Processing zipcode {zipcode} (weight: {zipcode_weight:.4f})")
-            
             # Add winners with their weighted rewards
             for miner_hotkey, reward_info in result['zipcode_rewards'].items():
                 if miner_hotkey not in miner_scores:
                     miner_scores[miner_hotkey] = 0.0
                 
                 # Weight the reward by zipcode size
-                weighted_reward = reward_info['reward_percentage'] * zipcode_weight
-                miner_scores[miner_hotkey] += weighted_reward
+                miner_scores[miner_hotkey] += reward_info['reward_percentage'] * zipcode_weight
                 all_winners.add(miner_hotkey)
-                
-                bt.logging.debug(f"Winner {miner_hotkey[:8]} in {zipcode}: "
-                               f"rank {reward_info['rank']}, "
-                               f"reward {reward_info['reward_percentage']:.2f}, "
-                               f"weighted {weighted_reward:.4f}")
+            
+            # One summary line per zipcode rather than one per winner
+            bt.logging.debug(f"Zipcode {zipcode} (weight: {zipcode_weight:.4f}) winners: " +
+                             ", ".join(f"#{info['rank']} {hotkey[:8]} "
+                                       f"(reward {info['reward_percentage']:.2f}, "
+                                       f"weighted {info['reward_percentage'] * zipcode_weight:.4f})"
+                                       for hotkey, info in result['zipcode_rewards'].items()))
             
             # Collect all participants for 5% distribution (excluding winners)
             for participant in result['participants']:
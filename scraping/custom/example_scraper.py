@@ -90,8 +90,8 @@ class CustomScraper(Scraper):
 
     def _create_data_entity(self, schema_data: PropertyDataSchema, label: DataLabel) -> DataEntity:
         """Create DataEntity from schema data."""
-        # Convert schema to JSON content
-        content = schema_data.model_dump_json()
+        # Convert schema to JSON content, encoded once for both content and size
+        content = schema_data.model_dump_json().encode('utf-8')
         
         # TODO: Create appropriate URI for your data
         # TODO: Example: uri = f"https://example.com/property/{schema_data.ids.custom.primary_id}"
@@ -106,7 +106,7 @@ class CustomScraper(Scraper):
             source=DataSource.SZILL_VALI,
             label=label,
             content=content,
-            content_size_bytes=len(content.encode()),
+            content_size_bytes=len(content),
         )
         
         return entity
@@ -1,4 +1,5 @@
 import datetime as dt
+import re
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 import json
@@ -6,6 +7,9 @@ import json
 from common.data import DataEntity, DataLabel, DataSource
 from scraping import utils
 
+# 5-digit zipcode at the end of an address, compiled once for all conversions
+ZIPCODE_PATTERN = re.compile(r'\b(\d{5})\b')
+
 
 class RealEstateContent(BaseModel):
     """Content model for real estate listings collected by a custom scraper"""
@@ -147,8 +151,7 @@ class RealEstateContent(BaseModel):
         if address_parts:
             last_part = address_parts[-1].strip()
             # Look for 5-digit zipcode pattern
-            import re
-            zipcode_match = re.search(r'\b(\d{5})\b', last_part)
+            zipcode_match = ZIPCODE_PATTERN.search(last_part)
             if zipcode_match:
                 zipcode = zipcode_match.group(1)
         
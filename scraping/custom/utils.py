@@ -164,12 +164,9 @@ def validate_field_by_config(field_name: str, actual_val: Any, miner_val: Any,
         ValidationResult for this field
     """
     try:
-        if config.validation_type == 'exact':
-            return validate_exact_match(field_name, actual_val, miner_val, config, entity)
-        elif config.validation_type == 'tolerance':
-            return validate_with_tolerance(field_name, actual_val, miner_val, config, entity)
-        elif config.validation_type == 'compatible':
-            return validate_compatible_values(field_name, actual_val, miner_val, config, entity)
+        validator = FIELD_VALIDATORS_BY_TYPE.get(config.validation_type)
+        if validator:
+            return validator(field_name, actual_val, miner_val, config, entity)
         else:
             # Unknown validation type - assume valid
             return ValidationResult(
@@ -321,6 +318,14 @@ def validate_compatible_values(field_name: str, actual_val: Any, miner_val: Any,
     return validate_exact_match(field_name, actual_val, miner_val, config, entity)
 
 
+# Dispatch table for FieldValidationConfig.validation_type
+FIELD_VALIDATORS_BY_TYPE = {
+    'exact': validate_exact_match,
+    'tolerance': validate_with_tolerance,
+    'compatible': validate_compatible_values,
+}
+
+
 def validate_time_sensitive_fields(actual_content: RealEstateContent, miner_content: RealEstateContent) -> ValidationResult:
     """
     Validate fields that may change over time with appropriate tolerance.
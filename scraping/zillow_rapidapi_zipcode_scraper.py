@@ -7,14 +7,54 @@ Miners should replace this with custom scrapers for better cost efficiency.
 """
 
 import asyncio
+import hashlib
+import re
 import httpx
 import time
 import random
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 import bittensor as bt
 
-from scraping.zipcode_scraper_interface import ZipcodeScraperInterface, ZipcodeScraperConfig
+from common.utils import json_dumps_bytes, json_loads
+from scraping.zipcode_scraper_interface import (
+    ZipcodeScraperInterface, ZipcodeScraperConfig, MIN_LISTING_PRICE, MAX_LISTING_PRICE
+)
+
+
+# Zillow URL building blocks, formatted once per property
+ZILLOW_DOMAIN = "https://www.zillow.com"
+ZILLOW_ZPID_URL_FMT = ZILLOW_DOMAIN + "/homedetails/{}_zpid/"
+
+_ZIP_RE = re.compile(r'\d{5}')  # Use with fullmatch: $ would accept a trailing newline
+
+# Zillow homeStatus -> listing_status
+LISTING_STATUS_MAP = {
+    'FOR_SALE': 'FOR_SALE',
+    'FOR_RENT': 'FOR_RENT',
+    'SOLD': 'SOLD',
+    'PENDING': 'PENDING',
+    'OFF_MARKET': 'OFF_MARKET',
+    'OTHER': 'FOR_SALE'  # Default fallback
+}
+
+# Zillow homeType -> property_type
+PROPERTY_TYPE_MAP = {
+    'SINGLE_FAMILY': 'SINGLE_FAMILY',
+    'CONDO': 'CONDO',
+    'TOWNHOUSE': 'TOWNHOUSE',
+    'MULTI_FAMILY': 'MULTI_FAMILY',
+    'MANUFACTURED': 'MANUFACTURED',
+    'LOT': 'LOT',
+    'APARTMENT': 'CONDO'  # Map apartment to condo
+}
+
+# Upper bound on a single retry backoff, matching the old fixed 429 wait
+MAX_RETRY_DELAY_SECONDS = 60.0
+
+# Slowest request spacing the adaptive rate limit will back off to
+MAX_REQUEST_INTERVAL_SECONDS = 30.0
 
 
 class RapidAPIZillowZipcodeScraper(ZipcodeScraperInterface):
@@ -52,13 +92,21 @@ class RapidAPIZillowZipcodeScraper(ZipcodeScraperInterface):
             "X-RapidAPI-Host": "zillow-com1.p.rapidapi.com"
         }
         
-        # Rate limiting
-        self.last_request_time = 0
+        # Rate limiting (monotonic time of the most recently reserved request slot)
+        self.last_request_time = float('-inf')
         self.min_request_interval = 60.0 / self.config.max_requests_per_minute
+        # Current spacing, widened on 429s and eased back toward the minimum on success
+        self.request_interval = self.min_request_interval
+        
+        # Optional on-disk response cache (disabled unless config.cache_dir is set)
+        self.cache_dir = Path(self.config.cache_dir) if self.config.cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Statistics
         self.stats = {
             'api_calls': 0,
+            'cache_hits': 0,
             'listings_scraped': 0,
             'errors': 0,
             'cost_estimate': 0.0
@@ -78,23 +126,29 @@ class RapidAPIZillowZipcodeScraper(ZipcodeScraperInterface):
         """
         bt.logging.info(f"RapidAPI Zillow scraper starting for zipcode {zipcode} (target: {target_count}, status: {self.status_type})")
         
-        start_time = time.time()
+        if not _ZIP_RE.fullmatch(str(zipcode)):
+            bt.logging.warning(f"Invalid zipcode format: {zipcode}")
+            return []
+        
+        start_time = time.monotonic()
         all_listings = []
+        seen_zpids = set()
         page = 1
         max_pages = 30  # Limit to prevent excessive API costs
         
+        # One client per scrape so every page reuses the same pooled connection
+        client = self._create_client()
+        
         try:
             while len(all_listings) < target_count and page <= max_pages:
                 # Check timeout
-                if time.time() - start_time > timeout:
+                if time.monotonic() - start_time > timeout:
                     bt.logging.warning(f"Timeout reached after {len(all_listings)} listings")
                     break
                 
-                # Rate limiting
-                await self._rate_limit()
-                
-                # Make API request
-                page_data = await self._fetch_page(zipcode, page)
+                # Make API request (page_time is when the page was actually fetched,
+                # which for a cached page is when it was cached)
+                page_data, page_time = await self._fetch_page(client, zipcode, page)
                 
                 if not page_data or 'props' not in page_data:
                     bt.logging.warning(f"No data returned for zipcode {zipcode}, page {page}")
@@ -105,26 +159,34 @@ class RapidAPIZillowZipcodeScraper(ZipcodeScraperInterface):
                     bt.logging.info(f"No more properties found on page {page}")
                     break
                 
-                # Convert API data to required format
+                # Convert API data to required format (the converter only returns
+                # listings that already satisfy validate_listing_data)
                 page_listings = []
+                conversion_errors = 0
+                last_error = None
                 for prop in props:
                     try:
-                        listing = self._convert_api_data_to_listing(prop, zipcode)
-                        if listing and self.validate_listing_data(listing):
+                        listing = self._convert_api_data_to_listing(prop, zipcode, page_time)
+                        # Pages sorted by newest can shift between requests and repeat
+                        # properties; validators reject submissions with duplicate zpids
+                        if listing and listing['zpid'] not in seen_zpids:
+                            seen_zpids.add(listing['zpid'])
                             page_listings.append(listing)
                     except Exception as e:
-                        bt.logging.warning(f"Error converting property data: {e}")
-                        continue
+                        conversion_errors += 1
+                        last_error = e
+                
+                if conversion_errors:
+                    bt.logging.warning(f"{conversion_errors} property conversion errors on page {page} "
+                                       f"(last: {last_error})")
                 
                 all_listings.extend(page_listings)
                 
-                bt.logging.info(f"Page {page}: Found {len(page_listings)} valid listings "
-                               f"(total: {len(all_listings)}/{target_count})")
+                bt.logging.debug(f"Page {page}: Found {len(page_listings)} valid listings "
+                                f"(total: {len(all_listings)}/{target_count})")
                 
-                # Update statistics
-                self.stats['api_calls'] += 1
+                # Update statistics (API calls and cost are counted in _fetch_page)
                 self.stats['listings_scraped'] += len(page_listings)
-                self.stats['cost_estimate'] += 0.015  # Estimate $0.015 per call
                 
                 page += 1
                 
@@ -134,9 +196,11 @@ class RapidAPIZillowZipcodeScraper(ZipcodeScraperInterface):
         except Exception as e:
             bt.logging.error(f"Error scraping zipcode {zipcode}: {e}")
             self.stats['errors'] += 1
+        finally:
+            await client.aclose()
         
         # Log final statistics
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         bt.logging.success(
             f"RapidAPI scraping complete for {zipcode}: "
             f"{len(all_listings)} listings in {elapsed_time:.1f}s "
@@ -146,183 +210,281 @@ class RapidAPIZillowZipcodeScraper(ZipcodeScraperInterface):
         return all_listings
     
     async def _rate_limit(self):
-        """Apply rate limiting between API requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        """
+        Apply rate limiting between API requests
+        
+        Each caller reserves the next free request slot before sleeping, so
+        concurrent scrapes sharing this scraper are spaced out globally
+        instead of all waking up at the same time.
+        """
+        current_time = time.monotonic()
+        request_time = max(current_time, self.last_request_time + self.request_interval)
+        self.last_request_time = request_time
+        
+        if request_time > current_time:
+            await asyncio.sleep(request_time - current_time)
+    
+    def _adjust_request_rate(self, throttled: bool):
+        """
+        Adapt the request spacing to API feedback (AIMD)
         
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            await asyncio.sleep(sleep_time)
+        A 429 doubles the spacing between requests for every scrape sharing
+        this scraper, up to MAX_REQUEST_INTERVAL_SECONDS or the configured
+        minimum, whichever is larger. Each successful response then shrinks it
+        by a tenth of the configured minimum, so the rate recovers gradually.
+        """
+        if throttled:
+            max_interval = max(MAX_REQUEST_INTERVAL_SECONDS, self.min_request_interval)
+            self.request_interval = min(self.request_interval * 2, max_interval)
+            bt.logging.debug(f"Rate limited, request interval now {self.request_interval:.1f}s")
+        elif self.request_interval > self.min_request_interval:
+            self.request_interval = max(self.min_request_interval,
+                                        self.request_interval - self.min_request_interval / 10)
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create the HTTP client shared by all page requests of a scrape
         
-        self.last_request_time = time.time()
+        Pages are requested one at a time, so a single keep-alive connection
+        is enough. Its expiry outlasts the rate-limit and page delays (httpx
+        defaults to 5s) so the connection survives between pages.
+        """
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=1, keepalive_expiry=60.0),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
     
-    async def _fetch_page(self, zipcode: str, page: int) -> Optional[Dict]:
+    async def _fetch_page(self, client: httpx.AsyncClient, zipcode: str, page: int) -> Tuple[Optional[Dict], Optional[datetime]]:
         """
         Fetch a page of property data from RapidAPI
         
         Args:
+            client: HTTP client from _create_client
             zipcode: Target zipcode
             page: Page number (1-based)
             
         Returns:
-            API response data or None if failed
+            Tuple of (API response data, time it was fetched from the API),
+            or (None, None) if failed
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                params = {
-                    "location": zipcode,
-                    "sort": "Newest",
-                    "page": page,
-                    "status_type": self.status_type
-                }
+            endpoint = "/propertyExtendedSearch"
+            params = {
+                "location": zipcode,
+                "sort": "Newest",
+                "page": page,
+                "status_type": self.status_type
+            }
+            
+            cache_path = self._get_cache_path(endpoint, params)
+            if cache_path:
+                cached = await asyncio.to_thread(self._read_cache, cache_path)
+                if cached is not None:
+                    self.stats['cache_hits'] += 1
+                    return cached
+            
+            for attempt in range(self.config.max_retries + 1):
+                # Rate limiting
+                await self._rate_limit()
+                
+                response = await client.get(endpoint, params=params)
                 
-                response = await client.get(
-                    f"{self.base_url}/propertyExtendedSearch",
-                    headers=self.headers,
-                    params=params
-                )
+                # Every request that reaches the API is billed, retries included
+                self.stats['api_calls'] += 1
+                self.stats['cost_estimate'] += 0.015  # Estimate $0.015 per call
                 
                 if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429:
-                    bt.logging.warning("Rate limit exceeded, waiting...")
-                    await asyncio.sleep(60)  # Wait 1 minute for rate limit reset
-                    return None
-                else:
-                    bt.logging.error(f"API error {response.status_code}: {response.text}")
-                    return None
-                    
+                    self._adjust_request_rate(throttled=False)
+                    data = json_loads(response.content)
+                    if cache_path:
+                        # Keep disk I/O off the event loop so concurrent scrapes keep fetching
+                        await asyncio.to_thread(self._write_cache, cache_path, data)
+                    return data, datetime.now(timezone.utc)
+                
+                # Rate limits and server errors are transient, so back off and retry
+                if response.status_code == 429:
+                    self._adjust_request_rate(throttled=True)
+                retryable = response.status_code == 429 or response.status_code >= 500
+                if retryable and attempt < self.config.max_retries:
+                    delay = self._get_retry_delay(response, attempt)
+                    bt.logging.warning(f"API error {response.status_code} for zipcode {zipcode}, page {page}; "
+                                       f"retrying in {delay:.1f}s ({attempt + 1}/{self.config.max_retries})")
+                    await asyncio.sleep(delay)
+                    continue
+                
+                # Error bodies can be large HTML pages, only log the start
+                bt.logging.error(f"API error {response.status_code}: {response.text[:200]}")
+                return None, None
+                
         except Exception as e:
             bt.logging.error(f"Request failed for zipcode {zipcode}, page {page}: {e}")
+            return None, None
+    
+    def _get_retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """
+        Get the backoff before retrying a failed request
+        
+        Honors a numeric Retry-After header when present, otherwise uses
+        exponential backoff with jitter. Capped at MAX_RETRY_DELAY_SECONDS.
+        """
+        retry_after = response.headers.get('Retry-After', '')
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = 2 ** attempt + random.random()
+        return min(max(delay, 0.0), MAX_RETRY_DELAY_SECONDS)
+    
+    def _get_cache_path(self, endpoint: str, params: Dict) -> Optional[Path]:
+        """Get the cache file for a request, or None if caching is disabled"""
+        if not self.cache_dir:
             return None
+        key = hashlib.sha1(f"{endpoint}|{sorted(params.items())}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
     
-    def _convert_api_data_to_listing(self, prop: Dict, zipcode: str) -> Optional[Dict]:
+    def _read_cache(self, cache_path: Path) -> Optional[Tuple[Dict, datetime]]:
+        """
+        Load a cached response if it exists and has not expired
+        
+        Returns the response together with the time it was cached, so listings
+        built from it are not stamped as freshly scraped.
+        """
+        try:
+            cached_at = cache_path.stat().st_mtime
+            if time.time() - cached_at > self.config.cache_ttl_seconds:
+                return None
+            return json_loads(cache_path.read_bytes()), datetime.fromtimestamp(cached_at, timezone.utc)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, cache_path: Path, data: Dict):
+        """Store a successful response in the cache"""
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            tmp_path.write_bytes(json_dumps_bytes(data))
+            tmp_path.replace(cache_path)
+        except (OSError, TypeError) as e:
+            bt.logging.debug(f"Failed to cache response at {cache_path}: {e}")
+    
+    def _convert_api_data_to_listing(self, prop: Dict, zipcode: str, now: Optional[datetime] = None) -> Optional[Dict]:
         """
         Convert RapidAPI property data to required listing format
         
+        The checks from validate_listing_data are applied inline here, so the
+        returned listing is already valid. The zipcode format is checked once
+        per scrape in scrape_zipcode.
+        
         Args:
             prop: Property data from API
             zipcode: Target zipcode
+            now: Scrape time shared by every listing on the page (defaults to the current time)
             
         Returns:
             Formatted listing dictionary or None if invalid
-        """
-        try:
-            # Extract required fields with proper mapping
-            zpid = str(prop.get('zpid', ''))
-            if not zpid:
-                return None
-            
-            # Address handling
-            address_obj = prop.get('address', {})
-            if isinstance(address_obj, dict):
-                street = address_obj.get('streetAddress', '')
-                city = address_obj.get('city', '')
-                state = address_obj.get('state', '')
-                zip_code = address_obj.get('zipcode', zipcode)
-                address = f"{street}, {city}, {state} {zip_code}".strip(', ')
-                
-                # Validate we got a real address, not just city/state
-                if not street or street.strip() == '':
-                    return None  # Skip properties without proper street address
-            else:
-                # If address is not a proper dict, skip this property
-                return None
-            
-            # Property details with safe extraction
-            bedrooms = prop.get('bedrooms')
-            bathrooms = prop.get('bathrooms')
-            living_area = prop.get('livingArea') or prop.get('livingAreaValue')
             
-            # Price information
-            price = prop.get('price')
-            if not price:
-                return None  # Skip properties without price
-            
-            # Listing status mapping
-            home_status = prop.get('homeStatus', 'UNKNOWN')
-            listing_status_map = {
-                'FOR_SALE': 'FOR_SALE',
-                'FOR_RENT': 'FOR_RENT', 
-                'SOLD': 'SOLD',
-                'PENDING': 'PENDING',
-                'OFF_MARKET': 'OFF_MARKET',
-                'OTHER': 'FOR_SALE'  # Default fallback
-            }
-            listing_status = listing_status_map.get(home_status, 'FOR_SALE')
-            
-            # Property type mapping
-            home_type = prop.get('homeType', 'UNKNOWN')
-            property_type_map = {
-                'SINGLE_FAMILY': 'SINGLE_FAMILY',
-                'CONDO': 'CONDO',
-                'TOWNHOUSE': 'TOWNHOUSE',
-                'MULTI_FAMILY': 'MULTI_FAMILY',
-                'MANUFACTURED': 'MANUFACTURED',
-                'LOT': 'LOT',
-                'APARTMENT': 'CONDO'  # Map apartment to condo
-            }
-            property_type = property_type_map.get(home_type, 'SINGLE_FAMILY')
+        Raises:
+            Exception: If the property data is malformed; the caller counts
+                these and reports them once per page
+        """
+        # Extract required fields with proper mapping
+        zpid = str(prop.get('zpid', ''))
+        if not zpid:
+            return None
+        
+        # Address handling
+        address_obj = prop.get('address', {})
+        if isinstance(address_obj, dict):
+            street = address_obj.get('streetAddress', '')
+            city = address_obj.get('city', '')
+            state = address_obj.get('state', '')
+            zip_code = address_obj.get('zipcode', zipcode)
+            address = f"{street}, {city}, {state} {zip_code}".strip(', ')
             
-            # Dates and market info
-            now = datetime.now(timezone.utc)
-            days_on_market = prop.get('daysOnZillow') or prop.get('timeOnZillow', 0)
+            # Validate we got a real address, not just city/state
+            if not street or street.strip() == '':
+                return None  # Skip properties without proper street address
+        else:
+            # If address is not a proper dict, skip this property
+            return None
+        
+        # Property details with safe extraction
+        bedrooms = prop.get('bedrooms')
+        bathrooms = prop.get('bathrooms')
+        living_area = prop.get('livingArea') or prop.get('livingAreaValue')
+        
+        # Price information
+        price = prop.get('price')
+        if not price:
+            return None  # Skip properties without price
+        price = int(price)
+        if price < MIN_LISTING_PRICE or price > MAX_LISTING_PRICE:
+            return None  # Skip unreasonable prices
+        
+        # Listing status mapping
+        home_status = prop.get('homeStatus', 'UNKNOWN')
+        listing_status = LISTING_STATUS_MAP.get(home_status, 'FOR_SALE')
+        
+        # Property type mapping
+        home_type = prop.get('homeType', 'UNKNOWN')
+        property_type = PROPERTY_TYPE_MAP.get(home_type, 'SINGLE_FAMILY')
+        
+        # Dates and market info
+        now = now or datetime.now(timezone.utc)
+        days_on_market = prop.get('daysOnZillow') or prop.get('timeOnZillow', 0)
+        
+        # Try to extract listing date
+        if days_on_market and isinstance(days_on_market, (int, float)):
+            listing_date = now - timedelta(days=int(days_on_market))
+        else:
+            listing_date = now  # Fallback to current date
+        
+        # Generate source URL
+        detail_url = prop.get('detailUrl') or prop.get('hdpUrl', '')
+        if detail_url:
+            # Relative URLs start with '/', absolute ones with 'http'
+            source_url = detail_url if detail_url[:1] == 'h' else ZILLOW_DOMAIN + detail_url
+        else:
+            # No detail_url provided, construct default
+            source_url = ZILLOW_ZPID_URL_FMT.format(zpid)
+        
+        # Create listing dictionary with all required fields
+        listing = {
+            # Required identifiers
+            'zpid': zpid,
+            'mls_id': prop.get('mlsid') or f"RAPID_{zpid}",
             
-            # Try to extract listing date
-            if days_on_market and isinstance(days_on_market, (int, float)):
-                listing_date = now - timedelta(days=int(days_on_market))
-            else:
-                listing_date = now  # Fallback to current date
+            # Required property info
+            'address': address,
+            'price': price,
+            'property_type': property_type,
+            'listing_status': listing_status,
             
-            # Generate source URL
-            detail_url = prop.get('detailUrl') or prop.get('hdpUrl', '')
-            if detail_url:
-                source_url = detail_url if detail_url.startswith('http') else f"https://www.zillow.com{detail_url}"
-            else:
-                # No detail_url provided, construct default
-                source_url = f"https://www.zillow.com/homedetails/{zpid}_zpid/"
+            # Required metadata
+            'listing_date': listing_date.isoformat(),
+            'source_url': source_url,
+            'scraped_timestamp': now.isoformat(),
+            'zipcode': zipcode,
             
-            # Create listing dictionary with all required fields
-            listing = {
-                # Required identifiers
-                'zpid': zpid,
-                'mls_id': prop.get('mlsid') or f"RAPID_{zpid}",
-                
-                # Required property info
-                'address': address,
-                'price': int(price),
-                'property_type': property_type,
-                'listing_status': listing_status,
-                
-                # Required metadata
-                'listing_date': listing_date.isoformat(),
-                'source_url': source_url,
-                'scraped_timestamp': now.isoformat(),
-                'zipcode': zipcode,
-                
-                # Optional but commonly available fields
-                'bedrooms': int(bedrooms) if bedrooms is not None else None,
-                'bathrooms': float(bathrooms) if bathrooms is not None else None,
-                'sqft': int(living_area) if living_area else None,
-                'days_on_market': int(days_on_market) if days_on_market else None,
-                
-                # Additional valuable fields
-                'lot_size': prop.get('lotAreaValue'),
-                'year_built': prop.get('yearBuilt'),
-                'zestimate': prop.get('zestimate'),
-                'latitude': prop.get('latitude'),
-                'longitude': prop.get('longitude'),
-                
-                # Data source metadata
-                'data_source': 'rapidapi_zillow',
-                'api_cost_estimate': 0.015
-            }
+            # Optional but commonly available fields
+            'bedrooms': int(bedrooms) if bedrooms is not None else None,
+            'bathrooms': float(bathrooms) if bathrooms is not None else None,
+            'sqft': int(living_area) if living_area else None,
+            'days_on_market': int(days_on_market) if days_on_market else None,
             
-            return listing
+            # Additional valuable fields
+            'lot_size': prop.get('lotAreaValue'),
+            'year_built': prop.get('yearBuilt'),
+            'zestimate': prop.get('zestimate'),
+            'latitude': prop.get('latitude'),
+            'longitude': prop.get('longitude'),
             
-        except Exception as e:
-            bt.logging.warning(f"Error converting property data: {e}")
-            return None
+            # Data source metadata
+            'data_source': 'rapidapi_zillow',
+            'api_cost_estimate': 0.015
+        }
+        
+        return listing
     
     def get_scraper_info(self) -> Dict[str, str]:
         """Get scraper information"""
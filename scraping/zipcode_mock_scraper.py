@@ -7,10 +7,11 @@ realistic synthetic real estate data for testing and development purposes.
 Miners should replace this with their own real scraper implementations.
 """
 
+import asyncio
 import random
 import time
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict
+from typing import List, Dict, Optional
 import bittensor as bt
 
 from scraping.zipcode_scraper_interface import ZipcodeScraperInterface, ZipcodeScraperConfig
@@ -49,7 +50,7 @@ class MockZipcodeScraper(ZipcodeScraperInterface):
             "FOR_SALE", "PENDING", "CONTINGENT", "SOLD"
         ]
     
-    def scrape_zipcode(self, zipcode: str, target_count: int, timeout: int = 300) -> List[Dict]:
+    async def scrape_zipcode(self, zipcode: str, target_count: int, timeout: int = 300) -> List[Dict]:
         """
         Generate mock real estate listings for a zipcode
         
@@ -63,7 +64,7 @@ class MockZipcodeScraper(ZipcodeScraperInterface):
         """
         bt.logging.info(f"Mock scraper generating {target_count} listings for zipcode {zipcode}")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         listings = []
         
         # Generate listings with better success rate for testing (within Tier 1 tolerance)
@@ -71,17 +72,20 @@ class MockZipcodeScraper(ZipcodeScraperInterface):
         min_count = int(target_count * 0.90)  # 90% of target (above 85% minimum)
         max_count = int(target_count * 1.10)  # 110% of target (below 115% maximum)
         actual_count = random.randint(min_count, max_count)
+        request_delay = self.config.request_delay_seconds
+        scrape_time = datetime.now(timezone.utc)
         
         for i in range(actual_count):
             # Check timeout
-            if time.time() - start_time > timeout:
+            if time.monotonic() - start_time > timeout:
                 bt.logging.warning(f"Mock scraper timeout after {len(listings)} listings")
                 break
             
-            # Simulate scraping delay
-            time.sleep(self.config.request_delay_seconds * random.uniform(0.5, 1.5))
+            # Simulate scraping delay (skipped entirely when configured to zero)
+            if request_delay > 0:
+                await asyncio.sleep(request_delay * random.uniform(0.5, 1.5))
             
-            listing = self._generate_mock_listing(zipcode, i)
+            listing = self._generate_mock_listing(zipcode, i, now=scrape_time)
             
             if self.validate_listing_data(listing):
                 listings.append(listing)
@@ -91,7 +95,7 @@ class MockZipcodeScraper(ZipcodeScraperInterface):
         bt.logging.success(f"Mock scraper generated {len(listings)} valid listings for {zipcode}")
         return listings
     
-    def _generate_mock_listing(self, zipcode: str, index: int) -> Dict:
+    def _generate_mock_listing(self, zipcode: str, index: int, now: Optional[datetime] = None) -> Dict:
         """Generate a single mock listing"""
         
         # Generate realistic property details (ensure high completeness for testing)
@@ -110,7 +114,7 @@ class MockZipcodeScraper(ZipcodeScraperInterface):
         price = int(base_price * random.uniform(0.7, 1.8))
         
         # Generate dates (use timezone-aware datetimes for consistency validation)
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
         listing_date = now - timedelta(days=random.randint(1, 180))
         days_on_market = (now - listing_date).days
         
@@ -185,7 +189,7 @@ To replace this mock scraper with your own implementation:
 Example:
 
 class MyCustomScraper(ZipcodeScraperInterface):
-    def scrape_zipcode(self, zipcode: str, target_count: int, timeout: int = 300) -> List[Dict]:
+    async def scrape_zipcode(self, zipcode: str, target_count: int, timeout: int = 300) -> List[Dict]:
         # Your scraping logic here
         # Connect to real estate websites
         # Parse HTML/JSON responses
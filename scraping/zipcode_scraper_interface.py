@@ -11,6 +11,17 @@ from typing import List, Dict, Optional
 import bittensor as bt
 
 
+# Fields every listing must carry with a non-empty value
+REQUIRED_LISTING_FIELDS = (
+    'address', 'price', 'listing_date', 'property_type',
+    'listing_status', 'source_url', 'scraped_timestamp', 'zipcode'
+)
+
+# Accepted listing price range (inclusive)
+MIN_LISTING_PRICE = 1000
+MAX_LISTING_PRICE = 100000000
+
+
 class ZipcodeScraperInterface(ABC):
     """
     Abstract base class for zipcode-based real estate scrapers
@@ -20,10 +31,14 @@ class ZipcodeScraperInterface(ABC):
     """
     
     @abstractmethod
-    def scrape_zipcode(self, zipcode: str, target_count: int, timeout: int = 300) -> List[Dict]:
+    async def scrape_zipcode(self, zipcode: str, target_count: int, timeout: int = 300) -> List[Dict]:
         """
         Scrape real estate listings for a specific zipcode
         
+        Implementations should be coroutines so that several zipcodes can be
+        scraped concurrently on one event loop. Plain (synchronous) methods are
+        still accepted; the miner runs them in a worker thread, one at a time.
+        
         Args:
             zipcode: 5-digit US zipcode to scrape
             target_count: Expected number of listings to find
@@ -73,14 +88,9 @@ class ZipcodeScraperInterface(ABC):
         Returns:
             True if listing is valid, False otherwise
         """
-        required_fields = [
-            'address', 'price', 'listing_date', 'property_type', 
-            'listing_status', 'source_url', 'scraped_timestamp', 'zipcode'
-        ]
-        
         # Check required fields exist and are not empty
-        for field in required_fields:
-            if field not in listing or listing[field] is None or listing[field] == '':
+        for field in REQUIRED_LISTING_FIELDS:
+            if listing.get(field) in (None, ''):
                 bt.logging.warning(f"Listing missing required field: {field}")
                 return False
         
@@ -92,7 +102,7 @@ class ZipcodeScraperInterface(ABC):
         # Validate price is reasonable
         try:
             price = float(listing['price'])
-            if price < 1000 or price > 100000000:
+            if price < MIN_LISTING_PRICE or price > MAX_LISTING_PRICE:
                 bt.logging.warning(f"Listing price unreasonable: {price}")
                 return False
         except (ValueError, TypeError):
@@ -116,7 +126,9 @@ class ZipcodeScraperConfig:
                  request_delay_seconds: float = 2.0,
                  max_retries: int = 3,
                  user_agent: str = None,
-                 proxy_url: str = None):
+                 proxy_url: str = None,
+                 cache_dir: str = None,
+                 cache_ttl_seconds: int = 15 * 60):
         """
         Initialize scraper configuration
         
@@ -126,9 +138,14 @@ class ZipcodeScraperConfig:
             max_retries: Maximum retry attempts for failed requests
             user_agent: Custom user agent string
             proxy_url: Proxy URL for requests
+            cache_dir: Directory for cached API responses (None disables caching)
+            cache_ttl_seconds: Maximum age of a cached response before it is refetched
+                (keep short: "Newest" search results go stale quickly)
         """
         self.max_requests_per_minute = max_requests_per_minute
         self.request_delay_seconds = request_delay_seconds
         self.max_retries = max_retries
         self.user_agent = user_agent or "ResiLabs-Miner/1.0"
         self.proxy_url = proxy_url
+        self.cache_dir = cache_dir
+        self.cache_ttl_seconds = cache_ttl_seconds
@@ -534,10 +534,8 @@ class SqliteMinerStorage(MinerStorage):
             True if storage successful
         """
         try:
-            import json
-            
-            # Serialize listings data
-            listings_json = json.dumps(listings_data, default=str)
+            # Serialize listings data with orjson, stored as TEXT
+            listings_json = utils.json_dumps_bytes(listings_data).decode('utf-8')
             submission_time = dt.datetime.now(dt.timezone.utc)
             
             with contextlib.closing(self._create_connection()) as connection:
@@ -570,8 +568,6 @@ class SqliteMinerStorage(MinerStorage):
             Dict mapping zipcode -> list of listing data
         """
         try:
-            import json
-            
             with contextlib.closing(self._create_connection()) as connection:
                 cursor = connection.cursor()
                 
@@ -585,7 +581,7 @@ class SqliteMinerStorage(MinerStorage):
                 epoch_data = {}
                 for row in cursor:
                     zipcode = row['zipcode']
-                    listings_data = json.loads(row['listing_data'])
+                    listings_data = utils.json_loads(row['listing_data'])
                     
                     if zipcode not in epoch_data:
                         epoch_data[zipcode] = []
@@ -611,8 +607,6 @@ class SqliteMinerStorage(MinerStorage):
             List of listing dictionaries
         """
         try:
-            import json
-            
             with contextlib.closing(self._create_connection()) as connection:
                 cursor = connection.cursor()
                 
@@ -624,7 +618,7 @@ class SqliteMinerStorage(MinerStorage):
                 
                 all_listings = []
                 for row in cursor:
-                    listings_data = json.loads(row['listing_data'])
+                    listings_data = utils.json_loads(row['listing_data'])
                     all_listings.extend(listings_data)
                 
                 return all_listings
@@ -633,6 +627,32 @@ class SqliteMinerStorage(MinerStorage):
             bt.logging.error(f"Failed to retrieve epoch zipcode data: {e}")
             return []
     
+    def get_epoch_zipcode_counts(self, epoch_id: str, miner_hotkey: str) -> Dict[str, int]:
+        """
+        Get the zipcodes already stored for an epoch, without loading their listings
+        
+        Args:
+            epoch_id: Epoch ID
+            miner_hotkey: Miner's hotkey
+            
+        Returns:
+            Dict mapping zipcode -> stored listing count
+        """
+        try:
+            with contextlib.closing(self._create_connection()) as connection:
+                cursor = connection.cursor()
+                
+                cursor.execute("""
+                    SELECT zipcode, listing_count FROM EpochZipcodeData 
+                    WHERE epoch_id = ? AND miner_hotkey = ?
+                """, (epoch_id, miner_hotkey))
+                
+                return {row['zipcode']: row['listing_count'] for row in cursor}
+                
+        except Exception as e:
+            bt.logging.error(f"Failed to retrieve epoch zipcode counts: {e}")
+            return {}
+    
     def mark_epoch_data_uploaded(self, epoch_id: str, zipcode: str, miner_hotkey: str) -> bool:
         """
         Mark epoch data as uploaded to S3
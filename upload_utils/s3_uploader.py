@@ -66,6 +66,9 @@ class S3PartitionedUploader:
         self.output_dir = os.path.join(output_dir, self.miner_hotkey)
         self.chunk_size = chunk_size
 
+        # Create the local staging directory once instead of checking on every chunk
+        os.makedirs(self.output_dir, exist_ok=True)
+
         # Load processed state - tracks last processed info per job
         self.processed_state = self._load_processed_state()
 
@@ -345,10 +348,6 @@ class S3PartitionedUploader:
                 bt.logging.warning(f"No data after raw processing for job {job_id}")
                 return True
 
-            # Create local parquet file
-            if not os.path.exists(self.output_dir):
-                os.makedirs(self.output_dir, exist_ok=True)
-
             # Generate filename with timestamp and record count
             timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"data_{timestamp}_{len(raw_df)}.parquet"
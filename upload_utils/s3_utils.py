@@ -4,6 +4,14 @@ import requests
 import bittensor as bt
 from typing import Dict, Any, Optional
 
+# (connect, read) timeouts. A dead endpoint fails fast on connect instead of
+# hanging an upload worker; read stays generous for slow S3 responses.
+S3_UPLOAD_TIMEOUT = (5, 120)
+HEALTHCHECK_TIMEOUT = (3, 10)
+
+# Presigned POST returns 204 by default, or 200/201 when success_action_status is set
+S3_UPLOAD_SUCCESS_STATUSES = (200, 201, 204)
+
 
 class S3Auth:
     """Handles S3 authentication with blockchain commitments and Keypair signatures for job-based structure"""
@@ -80,9 +88,10 @@ class S3Auth:
 
             with open(file_path, 'rb') as f:
                 files = {'file': f}
-                response = requests.post(creds['url'], data=post_data, files=files)
+                response = requests.post(creds['url'], data=post_data, files=files,
+                                         timeout=S3_UPLOAD_TIMEOUT)
 
-            if response.status_code == 204:
+            if response.status_code in S3_UPLOAD_SUCCESS_STATUSES:
                 bt.logging.success(f"S3 upload success: {full_s3_path}")
                 return True
             else:
@@ -99,7 +108,7 @@ class S3Auth:
             bt.logging.info(f"Testing connection to: {self.s3_auth_url}/healthcheck")
             response = requests.get(
                 f"{self.s3_auth_url.rstrip('/')}/healthcheck",
-                timeout=10
+                timeout=HEALTHCHECK_TIMEOUT
             )
 
             if response.status_code == 200:
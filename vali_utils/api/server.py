@@ -1,3 +1,4 @@
+import socket
 import time
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -175,9 +176,22 @@ class ValidatorAPI:
         """Restart API server"""
         bt.logging.info("Restarting API server")
         self.stop()
-        time.sleep(2)  # Give it a moment to fully stop
+        self._wait_for_port_release(timeout=2.0)
         self.start()
 
+    def _wait_for_port_release(self, timeout: float):
+        """Wait until nothing accepts connections on the API port, for at most timeout seconds"""
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.1):
+                    pass
+            except OSError:
+                return
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+
     def stop(self):
         """Stop API server"""
         if self.server_thread and self.server_thread.is_alive():
@@ -98,6 +98,9 @@ class MinerEvaluator:
         self.epoch_miners_evaluated = set()
         self.epoch_start_block = None
         self.epoch_complete = False
+        
+        # (epoch_id, (total_expected_listings, zipcode_set)) for the last completed epoch fetched
+        self._epoch_expectations_cache = None
 
     def get_scorer(self) -> MinerScorer:
         """Returns the scorer used by the evaluator."""
@@ -117,6 +120,12 @@ class MinerEvaluator:
             4. Samples data from the data entity bucket and verifies the data is correct
             5. Passes the validation result to the scorer to update the miner's score.
         """
+        # One dendrite (and its HTTP session) serves every query to the miner in this evaluation.
+        async with bt.dendrite(wallet=self.wallet) as dendrite:
+            await self._eval_miner(uid, dendrite)
+
+    async def _eval_miner(self, uid: int, dendrite: bt.dendrite) -> None:
+        """Evaluates a miner using the provided dendrite. See eval_miner."""
         t_start = time.perf_counter()
 
         axon_info = None
@@ -128,7 +137,7 @@ class MinerEvaluator:
         bt.logging.info(f"{hotkey}: Evaluating miner.")
 
         # Query the miner for the latest index.
-        index = await self._update_and_get_miner_index(hotkey, uid, axon_info)
+        index = await self._update_and_get_miner_index(hotkey, uid, axon_info, dendrite)
         if not index:
             # The miner hasn't provided an index yet, so we can't validate them. Count as a failed validation.
             bt.logging.info(
@@ -196,16 +205,14 @@ class MinerEvaluator:
             f"{hotkey} Querying miner for Bucket ID: {chosen_data_entity_bucket.id}."
         )
 
-        responses = None
-        async with bt.dendrite(wallet=self.wallet) as dendrite:
-            responses = await dendrite.forward(
-                axons=[axon_info],
-                synapse=GetDataEntityBucket(
-                    data_entity_bucket_id=chosen_data_entity_bucket.id,
-                    version=constants.PROTOCOL_VERSION,
-                ),
-                timeout=140,
-            )
+        responses = await dendrite.forward(
+            axons=[axon_info],
+            synapse=GetDataEntityBucket(
+                data_entity_bucket_id=chosen_data_entity_bucket.id,
+                version=constants.PROTOCOL_VERSION,
+            ),
+            timeout=140,
+        )
         
         data_entity_bucket = vali_utils.get_single_successful_response(
             responses, GetDataEntityBucket
@@ -741,20 +748,18 @@ class MinerEvaluator:
             return None
 
     async def _update_and_get_miner_index(
-        self, hotkey: str, uid: int, miner_axon: bt.AxonInfo
+        self, hotkey: str, uid: int, miner_axon: bt.AxonInfo, dendrite: bt.dendrite
     ) -> Optional[ScorableMinerIndex]:
         """Updates the index for the specified miner, and returns the latest known index or None if the miner hasn't yet provided an index."""
 
         bt.logging.info(f"{hotkey}: Getting MinerIndex from miner.")
 
         try:
-            responses: List[GetMinerIndex] = None
-            async with bt.dendrite(wallet=self.wallet) as dendrite:
-                responses = await dendrite.forward(
-                    axons=[miner_axon],
-                    synapse=GetMinerIndex(version=constants.PROTOCOL_VERSION),
-                    timeout=120,
-                )
+            responses: List[GetMinerIndex] = await dendrite.forward(
+                axons=[miner_axon],
+                synapse=GetMinerIndex(version=constants.PROTOCOL_VERSION),
+                timeout=120,
+            )
 
             response = vali_utils.get_single_successful_response(
                 responses, GetMinerIndex
@@ -927,18 +932,23 @@ class MinerEvaluator:
     def _get_expected_listings_and_zipcodes(self) -> Tuple[Optional[int], Optional[Set[str]]]:
         """
         Get both the total expected listings AND zipcode set for the most recently completed epoch.
-        Fetches data once to avoid duplicate API calls between Tier 1 and Tier 2 validation.
+        Fetches data once to avoid duplicate API calls between Tier 1 and Tier 2 validation,
+        and caches it per epoch since every miner evaluated in an epoch uses the same assignments.
         
         Returns:
             Tuple of (total_expected_listings, zipcode_set) where either can be None if unavailable
         """
         try:
-            from common.resi_api_client import create_api_client
-            api_client = create_api_client(self.config, self.wallet)
-            
             # Get the most recently completed epoch
             epoch_id = self._get_previous_epoch_id()
             
+            cached = self._epoch_expectations_cache
+            if cached and cached[0] == epoch_id:
+                return cached[1]
+            
+            from common.resi_api_client import create_api_client
+            api_client = create_api_client(self.config, self.wallet)
+            
             # Fetch epoch assignments from API
             epoch_data = api_client.get_epoch_assignments(epoch_id)
             
@@ -970,8 +980,10 @@ class MinerEvaluator:
                     f"total listings across {len(zipcodes_list)} zipcodes ({len(zipcode_set)} unique zipcodes)"
                 )
             
-            return (total_expected if total_expected > 0 else None, 
-                    zipcode_set if zipcode_set else None)
+            result = (total_expected if total_expected > 0 else None,
+                      zipcode_set if zipcode_set else None)
+            self._epoch_expectations_cache = (epoch_id, result)
+            return result
                 
         except Exception as e:
             bt.logging.debug(f"Error getting epoch data: {e}")
@@ -1046,13 +1058,15 @@ class MinerEvaluator:
         
         return passes, reason, metrics_data
     
-    def _apply_tier2_quality_validation(self, entities: List[DataEntity], epoch_zipcodes: Optional[Set[str]] = None) -> Tuple[bool, str, dict]:
+    def _apply_tier2_quality_validation(self, entities: List[DataEntity], epoch_zipcodes: Optional[Set[str]] = None,
+                                        parsed_listings: Optional[List[dict]] = None) -> Tuple[bool, str, dict]:
         """
         Tier 2: Data quality validation - field completeness, reasonable values, and epoch zipcode compliance
         
         Args:
             entities: List of data entities
             epoch_zipcodes: Optional set of zipcodes from completed epoch (passed from Tier 1 to avoid duplicate API calls)
+            parsed_listings: Optional already-parsed content of entities, to skip re-parsing their JSON
             
         Returns:
             Tuple of (passes, reason, metrics)
@@ -1060,18 +1074,25 @@ class MinerEvaluator:
         if not entities:
             return False, "No entities to validate", {'tier': 2}
         
-        # Parse real estate data from entities
+        # Parse real estate data from entities, unless the caller already has it
         listings = []
         parse_failures = 0
+        last_parse_error = None
         
-        for entity in entities:
-            try:
-                content_str = entity.content.decode('utf-8')
-                listing_data = json.loads(content_str)
-                listings.append(listing_data)
-            except Exception as e:
-                parse_failures += 1
-                bt.logging.debug(f"Failed to parse entity: {e}")
+        if parsed_listings is not None:
+            listings = parsed_listings
+        else:
+            for entity in entities:
+                try:
+                    # json.loads detects the UTF-8 encoding of bytes itself
+                    listings.append(json.loads(entity.content))
+                except Exception as e:
+                    parse_failures += 1
+                    last_parse_error = e
+        
+        if parse_failures:
+            # One summary line instead of one per entity, which could be thousands
+            bt.logging.debug(f"Failed to parse {parse_failures}/{len(entities)} entities (last error: {last_parse_error})")
         
         if not listings:
             return False, "Failed to parse any entities", {'tier': 2, 'parse_failures': parse_failures}
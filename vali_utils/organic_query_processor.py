@@ -276,7 +276,7 @@ class OrganicQueryProcessor:
         
         # Calculate consensus metrics from miners who actually found data
         median_count = statistics.median(non_zero_counts)
-        mean_count = statistics.mean(non_zero_counts) 
+        mean_count = sum(non_zero_counts) / len(non_zero_counts)
         consensus_count = max(median_count, mean_count)
         
         bt.logging.info(f"Volume consensus: {consensus_count:.1f} posts (median: {median_count}, mean: {mean_count:.1f})")
@@ -185,7 +185,8 @@ class S3Validator:
                 "expiry": timestamp + 86400
             }
             
-            response = requests.post(
+            response = await asyncio.to_thread(
+                requests.post,
                 f"{s3_auth_url}/get-miner-specific-access",
                 json=payload,
                 timeout=180
@@ -220,12 +221,15 @@ class S3Validator:
             job_folders, min(5, len(job_folders))
         )
         
-        for job_folder in sample_jobs:
+        # List the sampled jobs' files concurrently; each listing is an independent request
+        all_job_files = await asyncio.gather(
+            *(self._get_job_files(job_folder['presigned_url']) for job_folder in sample_jobs)
+        )
+        
+        for job_folder, job_files in zip(sample_jobs, all_job_files):
             job_id = job_folder['job_id']
             presigned_url = job_folder['presigned_url']
             
-            # Get files in job
-            job_files = await self._get_job_files(presigned_url)
             if not job_files:
                 continue
             
@@ -285,14 +289,20 @@ class S3Validator:
             if not file_urls:
                 continue
             
-            # Check URIs in files
-            for file_key, file_info in file_urls.items():
+            # Download the sampled files concurrently, then check URIs in file order
+            presigned_urls = [
+                file_info.get('presigned_url') for file_info in file_urls.values()
+                if file_info.get('presigned_url')
+            ]
+            dataframes = await asyncio.gather(
+                *(asyncio.to_thread(pd.read_parquet, presigned_url) for presigned_url in presigned_urls),
+                return_exceptions=True
+            )
+            
+            for df in dataframes:
                 try:
-                    presigned_url = file_info.get('presigned_url')
-                    if not presigned_url:
-                        continue
-                    
-                    df = pd.read_parquet(presigned_url)
+                    if isinstance(df, Exception):
+                        raise df
                     
                     # Sample rows to check for duplicates
                     sample_size = min(20, len(df))  # rows_per_file_sample = 20
@@ -355,7 +365,7 @@ class S3Validator:
                         try:
                             presigned_url = file_info.get('presigned_url')
                             if presigned_url:
-                                df = pd.read_parquet(presigned_url)
+                                df = await asyncio.to_thread(pd.read_parquet, presigned_url)
                                 
                                 # Sample rows from this file
                                 sample_size = min(3, len(df))
@@ -566,7 +576,7 @@ class S3Validator:
     async def _get_job_files(self, presigned_url: str) -> List[Dict]:
         """Get parquet files from job using proven XML parsing"""
         try:
-            response = requests.get(presigned_url, timeout=30)
+            response = await asyncio.to_thread(requests.get, presigned_url, timeout=30)
             if response.status_code != 200:
                 return []
             
@@ -636,7 +646,8 @@ class S3Validator:
                 "expiry": timestamp + 86400
             }
             
-            response = requests.post(
+            response = await asyncio.to_thread(
+                requests.post,
                 f"{s3_auth_url}/get-miner-specific-access",
                 json=payload,
                 timeout=60
@@ -726,7 +737,8 @@ async def get_miner_s3_validation_data(wallet, s3_auth_url: str, miner_hotkey: s
         }   
         bt.logging.info(f"Getting S3 access for {miner_hotkey}")
         bt.logging.info(f"Payload: {payload}")
-        response = requests.post(
+        response = await asyncio.to_thread(
+            requests.post,
             f"{s3_auth_url}/get-miner-specific-access",
             json=payload,
             timeout=60
@@ -742,7 +754,7 @@ async def get_miner_s3_validation_data(wallet, s3_auth_url: str, miner_hotkey: s
             raise Exception(f"No miner URL provided for {miner_hotkey}")
 
         # Parse S3 file list
-        xml_response = requests.get(miner_url, timeout=60)  # Increased timeout for S3 data fetch
+        xml_response = await asyncio.to_thread(requests.get, miner_url, timeout=60)  # Increased timeout for S3 data fetch
         
         if xml_response.status_code != 200:
             bt.logging.warning(f"Failed to get S3 file list for {miner_hotkey}: {xml_response.status_code}")
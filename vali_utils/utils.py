@@ -260,9 +260,8 @@ def are_entities_unique(entities: List[DataEntity]) -> bool:
         # Check 3 & 4: Extract zpid and verify consistency
         zpid = None
         try:
-            # Parse JSON content
-            content_str = entity.content.decode('utf-8')
-            content_dict = json.loads(content_str)
+            # Parse JSON content (json.loads decodes UTF-8 bytes itself)
+            content_dict = json.loads(entity.content)
             
             # Extract zpid from content (property identifier)
             zpid = content_dict.get('zpid')
@@ -22,6 +22,13 @@ class ValidatorS3Access:
         self.debug = debug
         self._cached_all_files = None
         self._cache_expiry = 0
+        self._coldkey = None
+
+    def _get_coldkey(self) -> str:
+        """Get the validator's coldkey address, reading the coldkeypub file only once"""
+        if self._coldkey is None:
+            self._coldkey = self.wallet.get_coldkeypub().ss58_address
+        return self._coldkey
 
     def _debug_print(self, message: str):
         """Print debug message if debug mode is enabled"""
@@ -68,7 +75,7 @@ class ValidatorS3Access:
     async def get_validator_access(self) -> Optional[Dict[str, Any]]:
         """Get S3 access using validator signature authentication"""
         try:
-            coldkey = self.wallet.get_coldkeypub().ss58_address
+            coldkey = self._get_coldkey()
             hotkey = self.wallet.hotkey.ss58_address
             timestamp = int(time.time())
 
@@ -122,7 +129,7 @@ class ValidatorS3Access:
     async def get_miner_specific_access(self, miner_hotkey: str) -> str:
         """Get presigned URL for specific miner's data"""
         try:
-            coldkey = self.wallet.get_coldkeypub().ss58_address
+            coldkey = self._get_coldkey()
             hotkey = self.wallet.hotkey.ss58_address
             timestamp = int(time.time())
 